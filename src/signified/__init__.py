@@ -9,6 +9,7 @@ Classes:
     Computed: A container for computed reactive values (from functions).
 
 Functions:
+    batch: Context manager that defers notifications until the end of the block.
     unref: Dereference a potentially reactive value.
     computed: Decorator to create a reactive value from a function.
     reactive_method: Decorator to create a reactive method.
@@ -23,18 +24,25 @@ Attributes:
 
 from __future__ import annotations
 
+import keyword
 import math
 import operator
 import sys
+import threading
+import types
+import weakref
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
-from functools import wraps
+from functools import partial, wraps
+from itertools import chain
 from typing import (
+    TYPE_CHECKING,
     Any,
     Callable,
     Generator,
     Generic,
     Iterable,
+    Iterator,
     Literal,
     Protocol,
     TypeVar,
@@ -44,7 +52,9 @@ from typing import (
 )
 
 import numpy as np
-from IPython.display import DisplayHandle, display
+
+if TYPE_CHECKING:
+    from IPython.display import DisplayHandle
 
 if sys.version_info >= (3, 11):
     from typing import Self
@@ -68,6 +78,7 @@ __all__ = [
     "HasValue",
     "ReactiveValue",
     "has_value",
+    "batch",
 ]
 
 T = TypeVar("T")
@@ -79,6 +90,41 @@ B = TypeVar("B")
 
 P = ParamSpec("P")
 
+_SCALAR_TYPES = frozenset(
+    {
+        int,
+        float,
+        bool,
+        complex,
+        str,
+        bytes,
+        bytearray,
+        range,
+        type(None),
+        type,
+        types.FunctionType,
+        types.BuiltinFunctionType,
+        types.MethodType,
+    }
+)
+"""Types that can never contain a reactive value, used to skip container traversal."""
+
+_VALUE_NAMES = frozenset({"value", "_value"})
+"""Attribute names that always refer to the reactive value itself, never to its contents."""
+
+_OWN_ATTRIBUTES = frozenset({"value", "_value", "_state", "_sources", "_observers", "_transient"})
+"""Attribute names that are always set on the reactive value itself, rather than on its contents."""
+
+_ndarray = np.ndarray
+"""Bound once so hot ``isinstance`` checks don't look up ``np.ndarray`` on every call."""
+
+_VARIABLE_TYPES: set[type] = set()
+"""Every subclass of [`Variable`][signified.Variable], registered by ``Variable.__init_subclass__``.
+
+Checking ``type(obj) in _VARIABLE_TYPES`` is much cheaper than ``isinstance(obj, Variable)``,
+which has to go through ``ABCMeta.__instancecheck__``.
+"""
+
 
 class Observer(Protocol):
     def update(self) -> None:
@@ -151,14 +197,46 @@ class ReactiveMixIn(Generic[T]):
 
             ```
         """
-        if name in {"value", "_value"}:
+        # Special names are looked up by Python and libraries (e.g., `__array_struct__`,
+        # `__deepcopy__`) to probe for protocols, which a reactive value doesn't implement
+        # just because its current value does
+        if name in _VALUE_NAMES or (name[:2] == "__" and name[-2:] == "__"):
             return super().__getattribute__(name)
 
-        if hasattr(self.value, name):
-            return computed(getattr)(self, name)
-        else:
+        # Evaluating the reactive value already looks the attribute up, so there's
+        # no need to probe for it first.
+        try:
+            return _GETATTR(self, name)
+        except AttributeError:
             return super().__getattribute__(name)
 
+    def attr(self, name: str) -> Computed[Any]:
+        """Return a reactive value for retrieving the attribute `name` from `self.value`.
+
+        Note:
+            Special (dunder) attributes can't be accessed reactively with dot notation, since
+            Python and libraries look them up to probe for protocols, so use this method instead.
+
+        Args:
+            name: The name of the attribute to access.
+
+        Returns:
+            A reactive value for `getattr(self.value, name)`.
+
+        Example:
+            ```py
+            >>> s = Signal(len)
+            >>> result = s.attr("__name__")
+            >>> result.value
+            'len'
+            >>> s.value = print
+            >>> result.value
+            'print'
+
+            ```
+        """
+        return _GETATTR(self, name)
+
     @overload
     def __call__(self: "ReactiveMixIn[Callable[..., R]]", *args: Any, **kwargs: Any) -> Computed[R]: ...
 
@@ -197,11 +275,7 @@ class ReactiveMixIn(Generic[T]):
         if not callable(self.value):
             raise ValueError("Value is not callable.")
 
-        def f(*args: Any, **kwargs: Any):
-            _f = getattr(self, "value")
-            return _f(*args, **kwargs)
-
-        return computed(f)(*args, **kwargs).observe([self, self.value])
+        return _CALL(self, *args, **kwargs)
 
     def __abs__(self) -> Computed[T]:
         """Return a reactive value for the absolute value of `self`.
@@ -221,7 +295,7 @@ class ReactiveMixIn(Generic[T]):
 
             ```
         """
-        return computed(abs)(self)
+        return _ABS(self)
 
     def bool(self) -> Computed[bool]:
         """Return a reactive value for the boolean value of `self`.
@@ -244,7 +318,7 @@ class ReactiveMixIn(Generic[T]):
 
             ```
         """
-        return computed(bool)(self)
+        return _BOOL(self)
 
     def __str__(self) -> str:
         """Return a string of the current value.
@@ -287,10 +361,10 @@ class ReactiveMixIn(Generic[T]):
         """
         if ndigits is None or ndigits == 0:
             # When ndigits is None or 0, round returns an integer
-            return cast(Computed[int], computed(round)(self, ndigits=ndigits))
+            return cast(Computed[int], _ROUND(self, ndigits=ndigits))
         else:
             # Otherwise, float
-            return cast(Computed[float], computed(round)(self, ndigits=ndigits))
+            return cast(Computed[float], _ROUND(self, ndigits=ndigits))
 
     def __ceil__(self) -> Computed[int]:
         """Return a reactive value for the ceiling of `self`.
@@ -311,7 +385,7 @@ class ReactiveMixIn(Generic[T]):
 
             ```
         """
-        return cast(Computed[int], computed(math.ceil)(self))
+        return cast(Computed[int], _CEIL(self))
 
     def __floor__(self) -> Computed[int]:
         """Return a reactive value for the floor of `self`.
@@ -332,7 +406,7 @@ class ReactiveMixIn(Generic[T]):
 
             ```
         """
-        return cast(Computed[int], computed(math.floor)(self))
+        return cast(Computed[int], _FLOOR(self))
 
     def __invert__(self) -> Computed[T]:
         """Return a reactive value for the bitwise inversion of `self`.
@@ -352,7 +426,7 @@ class ReactiveMixIn(Generic[T]):
 
             ```
         """
-        return computed(operator.inv)(self)
+        return _INV(self)
 
     def __neg__(self) -> Computed[T]:
         """Return a reactive value for the negation of `self`.
@@ -372,7 +446,7 @@ class ReactiveMixIn(Generic[T]):
 
             ```
         """
-        return computed(operator.neg)(self)
+        return _NEG(self)
 
     def __pos__(self) -> Computed[T]:
         """Return a reactive value for the positive of self.
@@ -392,7 +466,7 @@ class ReactiveMixIn(Generic[T]):
 
             ```
         """
-        return computed(operator.pos)(self)
+        return _POS(self)
 
     def __trunc__(self) -> Computed[T]:
         """Return a reactive value for the truncated value of `self`.
@@ -413,7 +487,7 @@ class ReactiveMixIn(Generic[T]):
 
             ```
         """
-        return computed(math.trunc)(self)
+        return _TRUNC(self)
 
     def __add__(self, other: HasValue[Y]) -> Computed[T | Y]:
         """Return a reactive value for the sum of `self` and `other`.
@@ -436,8 +510,7 @@ class ReactiveMixIn(Generic[T]):
 
             ```
         """
-        f: Callable[[T, Y], T | Y] = operator.add
-        return computed(f)(self, other)
+        return _ADD(self, other)
 
     def __and__(self, other: HasValue[Y]) -> Computed[bool]:
         """Return a reactive value for the bitwise AND of self and other.
@@ -460,7 +533,7 @@ class ReactiveMixIn(Generic[T]):
 
             ```
         """
-        return computed(operator.and_)(self, other)
+        return _AND(self, other)
 
     def contains(self, other: Any) -> Computed[bool]:
         """Return a reactive value for whether `other` is in `self`.
@@ -483,7 +556,7 @@ class ReactiveMixIn(Generic[T]):
 
             ```
         """
-        return computed(operator.contains)(self, other)
+        return _CONTAINS(self, other)
 
     def __divmod__(self, other: Any) -> Computed[tuple[float, float]]:
         """Return a reactive value for the divmod of `self` and other.
@@ -506,7 +579,7 @@ class ReactiveMixIn(Generic[T]):
 
             ```
         """
-        return cast(Computed[tuple[float, float]], computed(divmod)(self, other))
+        return cast(Computed[tuple[float, float]], _DIVMOD(self, other))
 
     def is_not(self, other: Any) -> Computed[bool]:
         """Return a reactive value for whether `self` is not other.
@@ -530,7 +603,7 @@ class ReactiveMixIn(Generic[T]):
 
             ```
         """
-        return computed(operator.is_not)(self, other)
+        return _IS_NOT(self, other)
 
     def eq(self, other: Any) -> Computed[bool]:
         """Return a reactive value for whether `self` equals other.
@@ -556,7 +629,7 @@ class ReactiveMixIn(Generic[T]):
 
             ```
         """
-        return computed(operator.eq)(self, other)
+        return _EQ(self, other)
 
     def __floordiv__(self, other: HasValue[Y]) -> Computed[T | Y]:
         """Return a reactive value for the floor division of `self` by other.
@@ -579,8 +652,7 @@ class ReactiveMixIn(Generic[T]):
 
             ```
         """
-        f: Callable[[T, Y], T | Y] = operator.floordiv
-        return computed(f)(self, other)
+        return _FLOORDIV(self, other)
 
     def __ge__(self, other: Any) -> Computed[bool]:
         """Return a reactive value for whether `self` is greater than or equal to other.
@@ -603,7 +675,7 @@ class ReactiveMixIn(Generic[T]):
 
             ```
         """
-        return computed(operator.ge)(self, other)
+        return _GE(self, other)
 
     def __gt__(self, other: Any) -> Computed[bool]:
         """Return a reactive value for whether `self` is greater than other.
@@ -626,7 +698,7 @@ class ReactiveMixIn(Generic[T]):
 
             ```
         """
-        return computed(operator.gt)(self, other)
+        return _GT(self, other)
 
     def __le__(self, other: Any) -> Computed[bool]:
         """Return a reactive value for whether `self` is less than or equal to `other`.
@@ -649,7 +721,7 @@ class ReactiveMixIn(Generic[T]):
 
             ```
         """
-        return computed(operator.le)(self, other)
+        return _LE(self, other)
 
     def __lt__(self, other: Any) -> Computed[bool]:
         """Return a reactive value for whether `self` is less than `other`.
@@ -672,7 +744,7 @@ class ReactiveMixIn(Generic[T]):
 
             ```
         """
-        return computed(operator.lt)(self, other)
+        return _LT(self, other)
 
     def __lshift__(self, other: HasValue[Y]) -> Computed[T | Y]:
         """Return a reactive value for `self` left-shifted by `other`.
@@ -695,8 +767,7 @@ class ReactiveMixIn(Generic[T]):
 
             ```
         """
-        f: Callable[[T, Y], T | Y] = operator.lshift
-        return computed(f)(self, other)
+        return _LSHIFT(self, other)
 
     def __matmul__(self, other: HasValue[Y]) -> Computed[T | Y]:
         """Return a reactive value for the matrix multiplication of `self` and `other`.
@@ -720,8 +791,7 @@ class ReactiveMixIn(Generic[T]):
 
             ```
         """
-        f: Callable[[T, Y], T | Y] = operator.matmul
-        return computed(f)(self, other)
+        return _MATMUL(self, other)
 
     def __mod__(self, other: HasValue[Y]) -> Computed[T | Y]:
         """Return a reactive value for `self` modulo `other`.
@@ -744,8 +814,7 @@ class ReactiveMixIn(Generic[T]):
 
             ```
         """
-        f: Callable[[T, Y], T | Y] = operator.mod
-        return computed(f)(self, other)
+        return _MOD(self, other)
 
     def __mul__(self, other: HasValue[Y]) -> Computed[T | Y]:
         """Return a reactive value for the product of `self` and `other`.
@@ -768,8 +837,7 @@ class ReactiveMixIn(Generic[T]):
 
             ```
         """
-        f: Callable[[T, Y], T | Y] = operator.mul
-        return computed(f)(self, other)
+        return _MUL(self, other)
 
     def __ne__(self, other: Any) -> Computed[bool]:  # type: ignore[override]
         """Return a reactive value for whether `self` is not equal to `other`.
@@ -792,7 +860,7 @@ class ReactiveMixIn(Generic[T]):
 
             ```
         """
-        return computed(operator.ne)(self, other)
+        return _NE(self, other)
 
     def __or__(self, other: Any) -> Computed[bool]:
         """Return a reactive value for the bitwise OR of `self` and `other`.
@@ -815,7 +883,7 @@ class ReactiveMixIn(Generic[T]):
 
             ```
         """
-        return computed(operator.or_)(self, other)
+        return _OR(self, other)
 
     def __rshift__(self, other: HasValue[Y]) -> Computed[T | Y]:
         """Return a reactive value for `self` right-shifted by `other`.
@@ -838,8 +906,7 @@ class ReactiveMixIn(Generic[T]):
 
             ```
         """
-        f: Callable[[T, Y], T | Y] = operator.rshift
-        return computed(f)(self, other)
+        return _RSHIFT(self, other)
 
     def __pow__(self, other: HasValue[Y]) -> Computed[T | Y]:
         """Return a reactive value for `self` raised to the power of `other`.
@@ -862,8 +929,7 @@ class ReactiveMixIn(Generic[T]):
 
             ```
         """
-        f: Callable[[T, Y], T | Y] = operator.pow
-        return computed(f)(self, other)
+        return _POW(self, other)
 
     def __sub__(self, other: HasValue[Y]) -> Computed[T | Y]:
         """Return a reactive value for the difference of `self` and `other`.
@@ -886,8 +952,7 @@ class ReactiveMixIn(Generic[T]):
 
             ```
         """
-        f: Callable[[T, Y], T | Y] = operator.sub
-        return computed(f)(self, other)
+        return _SUB(self, other)
 
     def __truediv__(self, other: HasValue[Y]) -> Computed[T | Y]:
         """Return a reactive value for `self` divided by `other`.
@@ -910,8 +975,7 @@ class ReactiveMixIn(Generic[T]):
 
             ```
         """
-        f: Callable[[T, Y], T | Y] = operator.truediv
-        return computed(f)(self, other)
+        return _TRUEDIV(self, other)
 
     def __xor__(self, other: Any) -> Computed[bool]:
         """Return a reactive value for the bitwise XOR of `self` and `other`.
@@ -934,7 +998,7 @@ class ReactiveMixIn(Generic[T]):
 
             ```
         """
-        return computed(operator.xor)(self, other)
+        return _XOR(self, other)
 
     def __radd__(self, other: HasValue[Y]) -> Computed[T | Y]:
         """Return a reactive value for the sum of `self` and `other`.
@@ -957,8 +1021,7 @@ class ReactiveMixIn(Generic[T]):
 
             ```
         """
-        f: Callable[[Y, T], T | Y] = operator.add
-        return computed(f)(other, self)
+        return _ADD(other, self)
 
     def __rand__(self, other: Any) -> Computed[bool]:
         """Return a reactive value for the bitwise AND of `self` and `other`.
@@ -981,7 +1044,7 @@ class ReactiveMixIn(Generic[T]):
 
             ```
         """
-        return computed(operator.and_)(other, self)
+        return _AND(other, self)
 
     def __rdivmod__(self, other: Any) -> Computed[tuple[float, float]]:
         """Return a reactive value for the divmod of `self` and `other`.
@@ -1004,7 +1067,7 @@ class ReactiveMixIn(Generic[T]):
 
             ```
         """
-        return cast(Computed[tuple[float, float]], computed(divmod)(other, self))
+        return cast(Computed[tuple[float, float]], _DIVMOD(other, self))
 
     def __rfloordiv__(self, other: HasValue[Y]) -> Computed[T | Y]:
         """Return a reactive value for the floor division of `other` by `self`.
@@ -1027,8 +1090,7 @@ class ReactiveMixIn(Generic[T]):
 
             ```
         """
-        f: Callable[[Y, T], T | Y] = operator.floordiv
-        return computed(f)(other, self)
+        return _FLOORDIV(other, self)
 
     def __rmod__(self, other: HasValue[Y]) -> Computed[T | Y]:
         """Return a reactive value for `other` modulo `self`.
@@ -1051,8 +1113,7 @@ class ReactiveMixIn(Generic[T]):
 
             ```
         """
-        f: Callable[[Y, T], T | Y] = operator.mod
-        return computed(f)(other, self)
+        return _MOD(other, self)
 
     def __rmul__(self, other: HasValue[Y]) -> Computed[T | Y]:
         """Return a reactive value for the product of `self` and `other`.
@@ -1075,8 +1136,7 @@ class ReactiveMixIn(Generic[T]):
 
             ```
         """
-        f: Callable[[Y, T], T | Y] = operator.mul
-        return computed(f)(other, self)
+        return _MUL(other, self)
 
     def __ror__(self, other: Any) -> Computed[bool]:
         """Return a reactive value for the bitwise OR of `self` and `other`.
@@ -1099,7 +1159,7 @@ class ReactiveMixIn(Generic[T]):
 
             ```
         """
-        return computed(operator.or_)(other, self)
+        return _OR(other, self)
 
     def __rpow__(self, other: HasValue[Y]) -> Computed[T | Y]:
         """Return a reactive value for `self` raised to the power of `other`.
@@ -1122,8 +1182,7 @@ class ReactiveMixIn(Generic[T]):
 
             ```
         """
-        f: Callable[[Y, T], T | Y] = operator.pow
-        return computed(f)(other, self)
+        return _POW(other, self)
 
     def __rsub__(self, other: HasValue[Y]) -> Computed[T | Y]:
         """Return a reactive value for the difference of `self` and `other`.
@@ -1146,8 +1205,7 @@ class ReactiveMixIn(Generic[T]):
 
             ```
         """
-        f: Callable[[Y, T], T | Y] = operator.sub
-        return computed(f)(other, self)
+        return _SUB(other, self)
 
     def __rtruediv__(self, other: HasValue[Y]) -> Computed[T | Y]:
         """Return a reactive value for `self` divided by `other`.
@@ -1170,8 +1228,7 @@ class ReactiveMixIn(Generic[T]):
 
             ```
         """
-        f: Callable[[Y, T], T | Y] = operator.truediv
-        return computed(f)(other, self)
+        return _TRUEDIV(other, self)
 
     def __rxor__(self, other: Any) -> Computed[bool]:
         """Return a reactive value for the bitwise XOR of `self` and `other`.
@@ -1194,7 +1251,7 @@ class ReactiveMixIn(Generic[T]):
 
             ```
         """
-        return computed(operator.xor)(other, self)
+        return _XOR(other, self)
 
     def __getitem__(self, key: Any) -> Computed[Any]:
         """Return a reactive value for the item or slice of `self`.
@@ -1217,7 +1274,7 @@ class ReactiveMixIn(Generic[T]):
 
             ```
         """
-        return computed(operator.getitem)(self, key)
+        return _GETITEM(self, key)
 
     def __setattr__(self, name: str, value: Any) -> None:
         """Set an attribute on the underlying `self.value`.
@@ -1250,13 +1307,13 @@ class ReactiveMixIn(Generic[T]):
 
             ```
         """
-        if name == "_value" or not hasattr(self, "_value"):
-            super().__setattr__(name, value)
+        if name in _OWN_ATTRIBUTES or not hasattr(self, "_value"):
+            object.__setattr__(self, name, value)
         elif hasattr(self.value, name):
             setattr(self.value, name, value)
             self.notify()
         else:
-            super().__setattr__(name, value)
+            object.__setattr__(self, name, value)
 
     def __setitem__(self, key: Any, value: Any) -> None:
         """Set an item on the underlying `self.value`.
@@ -1311,11 +1368,7 @@ class ReactiveMixIn(Generic[T]):
             ```
         """
 
-        @computed
-        def ternary(a: A, b: B, self: Any) -> A | B:
-            return a if self else b
-
-        return ternary(a, b, self)
+        return Computed(partial(_where, self, a, b), (a, b, self), _transient=True)
 
 
 class Variable(ABC, _HasValue[Y], ReactiveMixIn[T]):  # type: ignore[misc]
@@ -1329,15 +1382,43 @@ class Variable(ABC, _HasValue[Y], ReactiveMixIn[T]):  # type: ignore[misc]
 
     Subclasses should implement the `update` method.
 
+    Transient variables (e.g., the intermediate results of reactive operators) are only
+    weakly referenced by the variables they observe, so they are garbage collected as soon
+    as nothing else refers to them. While a transient variable has a non-transient observer,
+    the variables it observes hold it strongly instead, so it lives as long as they do.
+
     Attributes:
-        _observers (list[Observer]): List of observers subscribed to this variable.
+        _observers (list[Observer | weakref.ref[Observer]] | tuple[()]): Observers subscribed
+            to this variable. Transient observers are stored as weak references, which are
+            dropped once dead the next time the list is walked. Variables that have never had
+            an observer share the empty tuple instead of each allocating an empty list.
+        _transient (bool): Whether this variable is only weakly held by what it observes.
     """
 
-    __slots__ = ["_observers"]
+    __slots__ = ["_observers", "_transient"]
+
+    _state = 0
+    """Always up to date (`_CLEAN`); only computed values can be out of date."""
 
-    def __init__(self):
-        """Initialize the variable."""
-        self._observers: list[Observer] = []
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        _VARIABLE_TYPES.add(cls)
+
+    def __init__(self, *, _transient: bool = False):
+        """Initialize the variable.
+
+        Args:
+            _transient: Whether the variables this one observes should only hold a weak reference to it.
+        """
+        self._observers: list[Observer | weakref.ref[Observer]] | tuple[()] = ()
+        self._transient = _transient
+
+    def _index(self, observer: Observer) -> int:
+        """Return the position of `observer` in `self._observers`, or -1 if it isn't subscribed."""
+        for i, entry in enumerate(self._observers):
+            if entry is observer or (type(entry) is weakref.ref and entry() is observer):
+                return i
+        return -1
 
     def subscribe(self, observer: Observer) -> None:
         """Subscribe an observer to this variable.
@@ -1345,8 +1426,29 @@ class Variable(ABC, _HasValue[Y], ReactiveMixIn[T]):  # type: ignore[misc]
         Args:
             observer: The observer to subscribe.
         """
-        if observer not in self._observers:
-            self._observers.append(observer)
+        observers = self._observers
+        dead = False
+        for entry in observers:
+            if type(entry) is weakref.ref:
+                entry = entry()
+                if entry is None:
+                    dead = True
+                    continue
+            if entry is observer:
+                return
+        if dead:
+            _prune(observers)
+        written = _propagation.written
+        if written and id(self) in written:
+            # The new observer saw the value assigned within the batch, so it has to hear
+            # about the next change even if the signal is then restored.
+            _propagation.pending[id(self)] = self
+        if not observers:
+            observers = self._observers = []
+        if getattr(observer, "_transient", False):
+            observers.append(weakref.ref(observer))
+        else:
+            observers.append(observer)
 
     def unsubscribe(self, observer: Observer) -> None:
         """Unsubscribe an observer from this variable.
@@ -1354,8 +1456,10 @@ class Variable(ABC, _HasValue[Y], ReactiveMixIn[T]):  # type: ignore[misc]
         Args:
             observer: The observer to unsubscribe.
         """
-        if observer in self._observers:
-            self._observers.remove(observer)
+        i = self._index(observer)
+        if i == -1:
+            return
+        del self._observers[i]
 
     def observe(self, items: Any) -> Self:
         """Subscribe the observer (`self`) to all items that are Observable.
@@ -1369,14 +1473,9 @@ class Variable(ABC, _HasValue[Y], ReactiveMixIn[T]):  # type: ignore[misc]
             self
         """
 
-        def _observe(item: Any) -> None:
-            if isinstance(item, Variable) and item is not self:
+        for item in self._unique_variables(items):
+            if item is not self:
                 item.subscribe(self)
-            elif isinstance(item, Iterable) and not isinstance(item, str):
-                for sub_item in item:
-                    _observe(sub_item)
-
-        _observe(items)
         return self
 
     def unobserve(self, items: Any) -> Self:
@@ -1389,20 +1488,96 @@ class Variable(ABC, _HasValue[Y], ReactiveMixIn[T]):  # type: ignore[misc]
             self
         """
 
-        def _unobserve(item: Any) -> None:
-            if isinstance(item, Variable) and item is not self:
+        for item in self._unique_variables(items):
+            if item is not self:
                 item.unsubscribe(self)
-            elif isinstance(item, Iterable) and not isinstance(item, str):
-                for sub_item in item:
-                    _unobserve(sub_item)
-
-        _unobserve(items)
         return self
 
+    def _update_observations(self, old: Any, new: Any) -> None:
+        """Move the subscriptions of the observer (`self`) from the items in `old` to those in `new`.
+
+        Reactive values present in both are left subscribed rather than being
+        unsubscribed and immediately subscribed again.
+
+        Args:
+            old: The items currently observed.
+            new: The items to observe instead.
+        """
+        if type(old) in _SCALAR_TYPES and type(new) in _SCALAR_TYPES:
+            # Neither can contain reactive values (the common case when assigning a signal)
+            return
+        old_variables = {id(item): item for item in self._iter_variables(old) if item is not self}
+        new_variables = {id(item): item for item in self._iter_variables(new) if item is not self}
+        for key, item in old_variables.items():
+            if key not in new_variables:
+                item.unsubscribe(self)
+        for key, item in new_variables.items():
+            if key not in old_variables:
+                item.subscribe(self)
+
+    @staticmethod
+    def _unique_variables(items: Any) -> Iterable[Variable[Any, Any]]:
+        """Return the distinct reactive values within `items`, in order of first appearance.
+
+        A reactive value that appears several times (e.g., a shared intermediate result) is
+        only (un)subscribed once, rather than rescanning its observers for every occurrence.
+        """
+        return {id(item): item for item in Variable._iter_variables(items)}.values()
+
+    @staticmethod
+    def _iter_variables(item: Any) -> Generator[Variable[Any, Any], None, None]:
+        """Yield the reactive values within an arbitrarily nested structure.
+
+        Exact type checks handle scalars and builtin containers before falling back to
+        the (comparatively slow) ``isinstance`` checks against ABCs. Nested containers are
+        walked with an explicit stack of iterators rather than by recursion.
+
+        Args:
+            item: A single item, an iterable, or a nested structure of items.
+
+        Yields:
+            Each reactive value found, in traversal order.
+        """
+        stack: list[Iterator[Any]] = [iter((item,))]
+        while stack:
+            for item in stack[-1]:
+                t = type(item)
+                if t in _SCALAR_TYPES:
+                    continue
+                if t in _VARIABLE_TYPES:
+                    yield item
+                elif t is list or t is tuple:
+                    stack.append(iter(item))
+                    break
+                elif t is dict:
+                    stack.append(chain.from_iterable(item.items()))
+                    break
+                elif t is _ndarray and item.dtype != object:
+                    # Only object arrays can hold reactive values
+                    continue
+                elif isinstance(item, Iterable) and not isinstance(item, str):
+                    stack.append(iter(item))
+                    break
+            else:
+                stack.pop()
+
     def notify(self) -> None:
-        """Notify all observers by calling their update method."""
-        for observer in self._observers:
-            observer.update()
+        """Notify all observers that this variable changed.
+
+        Computed values downstream are marked as out of date, and other observers have
+        their `update` method called, each at most once even if it depends on this
+        variable along several paths. Inside a [`batch`][signified.batch], observers other
+        than computed values are only updated when the batch ends.
+        """
+        if not self._observers:
+            return
+        propagation = _propagation
+        propagation.pending[id(self)] = self
+        if not propagation.depth:
+            _flush()
+        else:
+            # Mark values downstream right away, so they're up to date if read within the batch
+            _mark_observers(self, effects=False)
 
     def __repr__(self) -> str:
         """Represent the object in a way that shows the inner value."""
@@ -1418,11 +1593,173 @@ class Variable(ABC, _HasValue[Y], ReactiveMixIn[T]):  # type: ignore[misc]
         raise NotImplementedError("Update method should be overridden by subclasses")
 
     def _ipython_display_(self) -> None:
+        # Only ever called from within IPython, so importing it here is free, and importing
+        # signified elsewhere doesn't pay for loading IPython
+        from IPython.display import display
+
         handle = display(self.value, display_id=True)
         assert handle is not None
         IPythonObserver(self, handle)
 
 
+class _PropagationState(threading.local):
+    """Batches and queued notifications, kept per thread so that each thread batches and notifies independently."""
+
+    def __init__(self) -> None:
+        self.depth = 0
+        """Number of active batches (including a flush in progress)."""
+        self.pending: dict[int, Variable[Any, Any]] = {}
+        """Variables that have changed but whose observers haven't been updated yet (each once, by id)."""
+        self.written: dict[int, tuple[Signal[Any], Any]] = {}
+        """Signals assigned within the current batch, with the value each held before its first assignment."""
+        self.eager: dict[int, Computed[Any]] = {}
+        """Marked computed values with observers that have to be updated as soon as the value changes."""
+        self.effects: dict[int, Any] = {}
+        """Observers (other than computed values) to update at the end of the current pass."""
+
+
+_propagation = _PropagationState()
+"""The propagation state of the current thread."""
+
+
+@contextmanager
+def batch() -> Generator[None, None, None]:
+    """Defer notifications until the end of the block.
+
+    Observers that depend on several values updated within the block are only updated
+    once, after all of the values have been set. Computed values read within the block
+    are still up to date. Batches may be nested, in which case observers are updated
+    when the outermost batch ends. Each thread has its own batches, so a batch only
+    defers the notifications of changes made by the thread that opened it.
+
+    Yields:
+        None
+
+    Example:
+        ```py
+        >>> a = Signal(1)
+        >>> b = Signal(2)
+        >>> total = computed(lambda x, y: print("computing") or x + y)(a, b)
+        computing
+        >>> with batch():
+        ...     a.value = 10
+        ...     b.value = 20
+        >>> total.value
+        computing
+        30
+
+        ```
+    """
+    propagation = _propagation
+    propagation.depth += 1
+    try:
+        yield
+    finally:
+        propagation.depth -= 1
+        # Flush even if the block raised, so observers aren't left out of date
+        if not propagation.depth:
+            _flush()
+
+
+def _prune(entries: list[Any]) -> None:
+    """Drop the dead weak references from a list of observers, in place."""
+    entries[:] = [entry for entry in entries if type(entry) is not weakref.ref or entry() is not None]
+
+
+def _flush() -> None:
+    """Propagate the changes of every changed variable.
+
+    Propagation happens in two phases. First, observers of the changed variables are
+    marked as dirty, and everything downstream of them as needing a check, without
+    evaluating anything. Then, computed values with observers that aren't computed
+    values themselves (e.g., an [`Echo`][signified.Echo]) are brought up to date, pulling
+    in whatever they depend on, and those observers are updated if the value changed.
+    Every computed value is evaluated at most once per pass, and only if something it
+    depends on actually changed.
+    """
+    propagation = _propagation
+    pending = propagation.pending
+    written = propagation.written
+    eager = propagation.eager
+    queued = propagation.effects
+    propagation.depth += 1
+    try:
+        while pending or written or eager or queued:
+            # Signals assigned back to the value they started the batch with haven't changed.
+            # Values downstream were already marked when the signals were assigned.
+            for signal, original in written.values():
+                if _changed(original, signal._value):
+                    _queue_effects(signal)
+            written.clear()
+            changed = list(pending.values())
+            pending.clear()
+            for variable in changed:
+                _mark_observers(variable)
+            while eager:
+                eager.pop(next(iter(eager)))._refresh()
+            effects = list(queued.values())
+            queued.clear()
+            for observer in effects:
+                observer.update()
+    except BaseException:
+        pending.clear()
+        written.clear()
+        eager.clear()
+        queued.clear()
+        raise
+    finally:
+        propagation.depth -= 1
+
+
+_CLEAN, _CHECK, _DIRTY = 0, 1, 2
+"""States of a computed value: up to date, possibly out of date, or out of date."""
+
+
+def _mark_observers(variable: Variable[Any, Any], effects: bool = True) -> None:
+    """Mark the observers of the changed `variable` as dirty, and everything downstream as needing a check.
+
+    Observers that aren't computed values are scheduled to be updated directly if they
+    observe `variable` (unless `effects` is false), or once the computed value they
+    observe has been brought up to date and turns out to have changed.
+
+    Observer lists are walked in place rather than copied, since no observer code runs
+    (and so nothing can subscribe or unsubscribe) while marking.
+    """
+    propagation = _propagation
+    stack: list[tuple[Variable[Any, Any], int]] = [(variable, _DIRTY)]
+    while stack:
+        node, state = stack.pop()
+        entries = node._observers
+        dead = False
+        for entry in reversed(entries):
+            observer = entry() if type(entry) is weakref.ref else entry
+            if observer is None:
+                dead = True
+            elif isinstance(observer, Computed):
+                previous = observer._state
+                if previous < state:
+                    _set_state(observer, state)
+                    # Marks already propagated from observers that weren't up to date
+                    if previous == _CLEAN:
+                        stack.append((observer, _CHECK))
+            elif node is variable:
+                if effects:
+                    propagation.effects[id(observer)] = observer
+            else:
+                propagation.eager[id(node)] = node
+        if dead:
+            _prune(entries)
+
+
+def _queue_effects(variable: Variable[Any, Any]) -> None:
+    """Schedule the observers of `variable` that aren't computed values to be updated."""
+    queued = _propagation.effects
+    for entry in reversed(variable._observers):
+        observer = entry() if type(entry) is weakref.ref else entry
+        if observer is not None and not isinstance(observer, Computed):
+            queued[id(observer)] = observer
+
+
 class Signal(Variable[NestedValue[T], T]):
     """A container that holds a reactive value.
 
@@ -1458,31 +1795,35 @@ class Signal(Variable[NestedValue[T], T]):
         Returns:
             The current value (when getting).
         """
-        return unref(self._value)
+        # Inlined `unref`, since this is the hottest path in the library
+        value = self._value
+        if type(value) in _VARIABLE_TYPES:
+            value = value.value  # pyright: ignore[reportAttributeAccessIssue]
+        return value
 
     @value.setter
     def value(self, new_value: HasValue[T]) -> None:
         old_value = self._value
-        change = new_value != old_value
-        if isinstance(change, np.ndarray):
-            change = change.any()
-        elif callable(old_value):
-            change = True
-        if change:
+        if _changed(old_value, new_value):
             self._value = cast(T, new_value)
-            self.unobserve(old_value)
-            self.observe(new_value)
-            self.notify()
-
-    @contextmanager
-    def at(self, value: T) -> Generator[None, None, None]:
+            self._update_observations(old_value, new_value)
+            if _propagation.depth and self._observers:
+                # Values downstream are marked right away, so they're up to date if read within
+                # the batch, but observers are only updated when the batch ends, and only if the
+                # value differs then
+                _propagation.written.setdefault(id(self), (self, old_value))
+                _mark_observers(self, effects=False)
+            else:
+                self.notify()
+
+    def at(self, value: T) -> _TemporaryValue[T]:
         """Temporarily set the signal to a given value within a context.
 
         Args:
             value: The temporary value to set.
 
-        Yields:
-            None
+        Returns:
+            A context manager that sets the value on entry and restores the previous value on exit.
 
         Example:
             ```py
@@ -1496,13 +1837,7 @@ class Signal(Variable[NestedValue[T], T]):
 
             ```
         """
-        before = self.value
-        try:
-            before = self.value
-            self.value = value
-            yield
-        finally:
-            self.value = before
+        return _TemporaryValue(self, value)
 
     def update(self) -> None:
         """Update the signal and notify subscribers."""
@@ -1512,6 +1847,12 @@ class Signal(Variable[NestedValue[T], T]):
 class Computed(Variable[T, T]):
     """A reactive value defined by a function.
 
+    Computed values are evaluated lazily: a change to a dependency only marks them as
+    out of date, and they're re-evaluated the next time their value is read. Computed
+    values observed by something other than another computed value (e.g., an
+    [`Echo`][signified.Echo]) are brought up to date as soon as a dependency changes,
+    so that observer can be notified if the value changed.
+
     Args:
         f: The function that computes the value.
         dependencies: Dependencies to observe.
@@ -1519,29 +1860,105 @@ class Computed(Variable[T, T]):
     Attributes:
         f (Callable[[], T]): The function that computes the value.
         _value (T): The current computed value.
+        _state (int): Whether `_value` is up to date (`_CLEAN`), may be out of date
+            because something upstream changed (`_CHECK`), or is out of date because a
+            dependency changed (`_DIRTY`).
+        _sources (list[Variable]): The variables this one observes. Computed values among
+            them are brought up to date before deciding whether to re-evaluate this one.
     """
 
-    __slots__ = ["f", "_value"]
+    __slots__ = ["f", "_value", "_state", "_sources"]
 
-    def __init__(self, f: Callable[[], T], dependencies: Any = None) -> None:
-        super().__init__()
-        self.f = f
-        self.observe(dependencies)
+    def __init__(self, f: Callable[[], T], dependencies: Any = None, *, _transient: bool = False) -> None:
+        super().__init__(_transient=_transient)
+        _set_f(self, f)
+        self._state = _CLEAN
+        self._sources: list[Variable[Any, Any]] = []
+        # Evaluate before subscribing, so a failing function doesn't leave subscriptions behind
         self._value = unref(self.f())
-        self.notify()
+        self.observe(dependencies)
+
+    def observe(self, items: Any) -> Self:
+        """Subscribe the observer (`self`) to all items that are Observable.
+
+        Args:
+            items: A single item, an iterable, or a nested structure of items to potentially subscribe to.
+
+        Returns:
+            self
+        """
+        for item in self._unique_variables(items):
+            if item is not self:
+                item.subscribe(self)
+                if item not in self._sources:
+                    self._sources.append(item)
+        return self
+
+    def unobserve(self, items: Any) -> Self:
+        """Unsubscribe the observer (`self`) from all items that are Observable.
+
+        Args:
+            items: A single item or an iterable of items to potentially unsubscribe from.
+
+        Returns:
+            self
+        """
+        for item in self._unique_variables(items):
+            if item is not self:
+                item.unsubscribe(self)
+                if item in self._sources:
+                    self._sources.remove(item)
+        return self
+
+    def subscribe(self, observer: Observer) -> None:
+        """Subscribe an observer to this variable.
+
+        Args:
+            observer: The observer to subscribe.
+        """
+        # Marks only propagate from up-to-date values, so bring this one up to date
+        # to make sure the new observer hears about the next change.
+        if self._state:
+            self._refresh()
+        super().subscribe(observer)
+        if self._transient and not getattr(observer, "_transient", False):
+            _hold(self)
+
+    def unsubscribe(self, observer: Observer) -> None:
+        """Unsubscribe an observer from this variable.
+
+        Args:
+            observer: The observer to unsubscribe.
+        """
+        super().unsubscribe(observer)
+        if self._transient and all(type(entry) is weakref.ref for entry in self._observers):
+            _release(self)
+
+    def _refresh(self) -> None:
+        """Bring the value up to date, re-evaluating the function only if a dependency changed."""
+        for source in self._sources:
+            if source._state:
+                for node in _stale_sources_first(self):
+                    node._reevaluate()
+                return
+        self._reevaluate()
+
+    def _reevaluate(self) -> None:
+        """Re-evaluate the function if a dependency changed, assuming the sources are up to date."""
+        dirty = self._state == _DIRTY
+        _set_state(self, _CLEAN)
+        if dirty:
+            new_value = self.f()
+            if _changed(self._value, new_value):
+                self._value: T = new_value
+                _mark_observers(self)
 
     def update(self) -> None:
         """Update the value by re-evaluating the function."""
-        new_value = self.f()
-        change = new_value != self._value
-        if isinstance(change, np.ndarray):
-            change = change.any()
-        elif callable(self._value):
-            change = True
-
-        if change:
-            self._value: T = new_value
-            self.notify()
+        self._state = _DIRTY
+        self._refresh()
+        if not _propagation.depth:
+            _flush()
 
     @property
     def value(self) -> T:
@@ -1550,7 +1967,80 @@ class Computed(Variable[T, T]):
         Returns:
             The current value.
         """
-        return unref(self._value)
+        if self._state:
+            self._refresh()
+        # Inlined `unref`, since this is the hottest path in the library
+        value = self._value
+        if type(value) in _VARIABLE_TYPES:
+            value = value.value  # pyright: ignore[reportAttributeAccessIssue]
+        return value
+
+
+_set_state: Callable[[Computed[Any], int], None] = Computed.__dict__["_state"].__set__
+"""Assign `Computed._state` directly, skipping `ReactiveMixIn.__setattr__` on the propagation hot paths."""
+
+_set_f: Callable[[Computed[Any], Callable[[], Any]], None] = Computed.__dict__["f"].__set__
+"""Assign `Computed.f` directly.
+
+`ReactiveMixIn.__setattr__` would first probe for the (not yet assigned) `_value`, which
+raises and is caught twice on every construction.
+"""
+
+
+def _hold(node: Computed[Any]) -> None:
+    """Make the variables that the transient `node` observes hold it strongly.
+
+    Transient values upstream that become strongly held this way are held in turn, so
+    the whole graph lives as long as the variables it's built on.
+    """
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        for source in node._sources:
+            entries = source._observers
+            for i, entry in enumerate(entries):
+                if type(entry) is weakref.ref and entry() is node:
+                    entries[i] = node
+                    if source._transient:
+                        stack.append(source)
+                    break
+
+
+def _release(node: Computed[Any]) -> None:
+    """Undo `_hold` once the transient `node` has no non-transient observers left."""
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        for source in node._sources:
+            entries = source._observers
+            for i, entry in enumerate(entries):
+                if entry is node:
+                    entries[i] = weakref.ref(node)
+                    if source._transient and all(type(entry) is weakref.ref for entry in entries):
+                        stack.append(source)
+                    break
+
+
+def _stale_sources_first(node: Computed[Any]) -> list[Computed[Any]]:
+    """Return `node` and the out-of-date computed values it depends on, dependencies first.
+
+    Walks the graph iteratively, so long chains of out-of-date values don't hit the
+    recursion limit when they're brought up to date.
+    """
+    order: list[Computed[Any]] = []
+    visited = {id(node)}
+    stack = [(node, iter(node._sources))]
+    while stack:
+        current, sources = stack[-1]
+        for source in sources:
+            if source._state and id(source) not in visited:
+                visited.add(id(source))
+                stack.append((source, iter(source._sources)))
+                break
+        else:
+            stack.pop()
+            order.append(current)
+    return order
 
 
 def unref(value: HasValue[T]) -> T:
@@ -1570,12 +2060,101 @@ def unref(value: HasValue[T]) -> T:
 
         ```
     """
-    while isinstance(value, Variable):
-        value = value._value
+    # `.value` resolves any further nesting (and brings dirty computed values up to date)
+    if type(value) in _VARIABLE_TYPES:
+        value = value.value  # pyright: ignore[reportAttributeAccessIssue]
     return cast(T, value)
 
 
+_ARRAY_CHUNK_SIZE = 1 << 14
+"""Number of elements compared at a time when checking large arrays for changes."""
+
+
+def _arrays_equal(a: np.ndarray, b: np.ndarray) -> bool:
+    """Check two arrays for equality, stopping at the first chunk that differs.
+
+    ``np.array_equal`` always compares every element and allocates a boolean array the
+    size of its inputs. For large contiguous arrays, compare fixed-size chunks instead so
+    that a change is detected without scanning (or allocating for) the remainder.
+    """
+    if a.shape != b.shape:
+        return False
+    if a.size <= _ARRAY_CHUNK_SIZE or not (a.flags.c_contiguous and b.flags.c_contiguous):
+        return bool(np.array_equal(a, b))
+    flat_a = a.reshape(-1)
+    flat_b = b.reshape(-1)
+    for start in range(0, flat_a.size, _ARRAY_CHUNK_SIZE):
+        stop = start + _ARRAY_CHUNK_SIZE
+        if not np.array_equal(flat_a[start:stop], flat_b[start:stop]):
+            return False
+    return True
+
+
+_CHEAP_EQ_TYPES = frozenset({int, float, bool, complex, str, bytes, type(None)})
+"""Types whose values can be compared with ``!=`` directly, always giving a plain bool."""
+
+
+def _changed(old: Any, new: Any) -> bool:
+    """Determine whether replacing `old` with `new` should notify observers.
+
+    Arrays are compared with ``np.array_equal`` (in chunks, for large arrays) up front
+    rather than by reducing an elementwise comparison, which also handles arrays of
+    different shapes. Callables are always considered changed. Anything else is
+    unchanged if it's the very same object, and builtin immutables of the same type
+    are compared directly.
+
+    Args:
+        old: The previous value.
+        new: The candidate new value.
+
+    Returns:
+        True if the value changed.
+    """
+    if new is old:
+        return callable(old)
+    t = type(old)
+    if t is type(new) and t in _CHEAP_EQ_TYPES:
+        return old != new
+    old_is_array = isinstance(old, _ndarray)
+    new_is_array = isinstance(new, _ndarray)
+    if old_is_array and new_is_array:
+        return not _arrays_equal(old, new)
+    if old_is_array or new_is_array:
+        return not np.array_equal(old, new)
+    if callable(old):
+        return True
+    change = new != old
+    if type(change) is bool:
+        return change
+    if isinstance(change, _ndarray):
+        return bool(change.any())
+    return bool(change)
+
+
+class _TemporaryValue(Generic[T]):
+    """Context manager returned by [`Signal.at`][signified.Signal.at].
+
+    A plain class rather than a ``contextmanager`` generator, since it's typically
+    entered in tight loops (set a value, read what depends on it, restore).
+    """
+
+    __slots__ = ["signal", "value", "before"]
+
+    def __init__(self, signal: Signal[T], value: T) -> None:
+        self.signal = signal
+        self.value = value
+
+    def __enter__(self) -> None:
+        self.before = self.signal.value
+        self.signal.value = self.value
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.signal.value = self.before
+
+
 class IPythonObserver:
+    __slots__ = ["me", "handle"]
+
     def __init__(self, me: Variable[Any, Any], handle: DisplayHandle):
         self.me = me
         self.handle = handle
@@ -1586,6 +2165,8 @@ class IPythonObserver:
 
 
 class Echo:
+    __slots__ = ["me"]
+
     def __init__(self, me: Variable[Any, Any]):
         self.me = me
         me.subscribe(self)
@@ -1627,18 +2208,181 @@ def computed(func: Callable[..., R]) -> Callable[..., Computed[R]]:
         ```
     """
 
+    return _make_computed(func, transient=False)
+
+
+def _derived(func: Callable[..., R]) -> Callable[..., Computed[R]]:
+    """Like [`computed`][signified.computed], but create transient reactive values.
+
+    Used for the intermediate values produced by reactive operators, which should not
+    outlive the references to them just because their dependencies are still around.
+    """
+    return _make_computed(func, transient=True)
+
+
+def _make_computed(func: Callable[..., R], transient: bool) -> Callable[..., Computed[R]]:
     @wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Computed[R]:
-        def compute_func() -> R:
-            resolved_args = tuple(deep_unref(arg) for arg in args)
-            resolved_kwargs = {key: deep_unref(value) for key, value in kwargs.items()}
-            return func(*resolved_args, **resolved_kwargs)
+        dependencies = (*args, *kwargs.values())
+        kinds = "".join(map(_arg_kind, dependencies))
+        if "c" * len(kinds) == kinds:
+            # Nothing to observe, so the value can never change: evaluate once, as is.
+            return Computed(partial(func, *args, **kwargs), _transient=transient)
+
+        kwarg_names = tuple(kwargs)
+        factory = None
+        if len(kinds) <= _MAX_COMPILED_ARGS:
+            factory = _COMPUTE_FUNC_FACTORIES.get((kinds, kwarg_names)) or _compute_func_factory(kinds, kwarg_names)
+        if factory is not None:
+            compute_func = factory(func, *dependencies)
+        else:
+            compute_func = partial(_resolve_and_call, func, args, kwargs)
 
-        return Computed(compute_func, (*args, *kwargs.values()))
+        return Computed(compute_func, dependencies, _transient=transient)
 
     return wrapper
 
 
+def _resolve_and_call(func: Callable[..., R], args: tuple[Any, ...], kwargs: dict[str, Any]) -> R:
+    """Call `func` with every argument unrefed, for argument shapes that can't be compiled."""
+    resolved_args = tuple(deep_unref(arg) for arg in args)
+    resolved_kwargs = {key: deep_unref(value) for key, value in kwargs.items()}
+    return func(*resolved_args, **resolved_kwargs)
+
+
+def _call(func: Callable[..., R], /, *args: Any, **kwargs: Any) -> R:
+    return func(*args, **kwargs)
+
+
+def _where(condition: Any, a: A, b: B) -> A | B:
+    """Resolve only the branch selected by `condition`."""
+    return deep_unref(a) if deep_unref(condition) else deep_unref(b)
+
+
+# Wrappers shared by the `ReactiveMixIn` methods, built once rather than on every call
+_CALL = _derived(_call)
+_GETATTR = _derived(getattr)
+_GETITEM = _derived(operator.getitem)
+_ABS = _derived(abs)
+_BOOL = _derived(bool)
+_ROUND = _derived(round)
+_CEIL = _derived(math.ceil)
+_FLOOR = _derived(math.floor)
+_TRUNC = _derived(math.trunc)
+_INV = _derived(operator.inv)
+_NEG = _derived(operator.neg)
+_POS = _derived(operator.pos)
+_ADD = _derived(operator.add)
+_AND = _derived(operator.and_)
+_CONTAINS = _derived(operator.contains)
+_DIVMOD = _derived(divmod)
+_EQ = _derived(operator.eq)
+_FLOORDIV = _derived(operator.floordiv)
+_GE = _derived(operator.ge)
+_GT = _derived(operator.gt)
+_IS_NOT = _derived(operator.is_not)
+_LE = _derived(operator.le)
+_LSHIFT = _derived(operator.lshift)
+_LT = _derived(operator.lt)
+_MATMUL = _derived(operator.matmul)
+_MOD = _derived(operator.mod)
+_MUL = _derived(operator.mul)
+_NE = _derived(operator.ne)
+_OR = _derived(operator.or_)
+_POW = _derived(operator.pow)
+_RSHIFT = _derived(operator.rshift)
+_SUB = _derived(operator.sub)
+_TRUEDIV = _derived(operator.truediv)
+_XOR = _derived(operator.xor)
+
+
+def _arg_kind(arg: Any) -> str:
+    """Classify an argument by how it has to be resolved on each recomputation.
+
+    Returns:
+        ``"v"`` for a reactive value, ``"c"`` for an immutable scalar, which is passed
+        through unchanged, or ``"d"`` for anything else (e.g., a container). Those are
+        unrefed afresh on every recomputation, so the function gets its own copy even
+        if they don't contain any reactive values.
+    """
+    t = type(arg)
+    if t in _VARIABLE_TYPES:
+        return "v"
+    if t in _SCALAR_TYPES:
+        return "c"
+    return "d"
+
+
+_MAX_COMPILED_ARGS = 4
+"""Calls with more arguments than this are resolved generically rather than compiled.
+
+Each distinct combination of argument kinds compiles a new factory, so this keeps the
+number of factories small.
+"""
+
+
+_COMPUTE_FUNC_FACTORIES: dict[tuple[str, tuple[str, ...]], Callable[..., Callable[[], Any]]] = {}
+"""Compiled compute function factories, keyed by the argument kinds and the keyword names."""
+
+_RESOLVERS = {
+    "v": "(v{0} if type(v{0} := {1}.value) in _SCALAR_TYPES else deep_unref(v{0}))",
+    "d": "deep_unref({1})",
+    "c": "{1}",
+}
+"""Expressions resolving an argument of each kind (see `_arg_kind`), formatted with its index and name."""
+
+
+def _compute_func_factory(kinds: str, kwarg_names: tuple[str, ...]) -> Callable[..., Callable[[], Any]] | None:
+    """Return a factory for compute functions that call a function with a given argument shape.
+
+    The generated compute function resolves each argument inline according to its kind,
+    e.g. for a reactive value, a constant, and a structure containing reactive values::
+
+        def factory(func, a0, a1, a2):
+            def compute_func():
+                return func(
+                    (v0 if type(v0 := a0.value) in _SCALAR_TYPES else deep_unref(v0)),
+                    a1,
+                    deep_unref(a2),
+                )
+            return compute_func
+
+    This avoids building an intermediate tuple and dict on every recomputation, never
+    re-walks constant arguments, and reads scalar values (the common case for operators)
+    straight from `.value`. Factories are compiled once per shape, and only for calls
+    with at most `_MAX_COMPILED_ARGS` arguments.
+
+    Args:
+        kinds: The kind of each positional and then keyword argument, as returned by `_arg_kind`.
+        kwarg_names: The names of the keyword arguments, in order.
+
+    Returns:
+        The factory, or None if the keyword names can't be compiled into a call.
+    """
+    key = (kinds, kwarg_names)
+    factory = _COMPUTE_FUNC_FACTORIES.get(key)
+    if factory is None:
+        if not all(name.isidentifier() and not keyword.iskeyword(name) for name in kwarg_names):
+            return None
+        params = [f"a{i}" for i in range(len(kinds))]
+        call_args = [_RESOLVERS[kind].format(i, param) for i, (kind, param) in enumerate(zip(kinds, params))]
+        nargs = len(kinds) - len(kwarg_names)
+        call_args[nargs:] = [f"{name}={arg}" for name, arg in zip(kwarg_names, call_args[nargs:])]
+        source = (
+            f"def factory(func, {', '.join(params)}):\n"
+            f"    def compute_func():\n"
+            f"        return func({', '.join(call_args)})\n"
+            f"    return compute_func\n"
+        )
+        namespace: dict[str, Any] = {"deep_unref": deep_unref, "_SCALAR_TYPES": _SCALAR_TYPES}
+        exec(source, namespace)
+        factory = _COMPUTE_FUNC_FACTORIES[key] = namespace["factory"]
+    return factory
+
+
+_MISSING = object()
+"""Sentinel for attributes that don't exist."""
+
 # Note: `Any` is used to handle `self` in methods.
 InstanceMethod = Callable[Concatenate[Any, P], T]
 ReactiveMethod = Callable[Concatenate[Any, P], Computed[T]]
@@ -1653,12 +2397,27 @@ def reactive_method(*dep_names: str) -> Callable[[InstanceMethod[P, T]], Reactiv
         A decorator function.
     """
 
+    get_deps = operator.attrgetter(*dep_names) if dep_names else None
+
+    def resolve_deps(self: Any) -> tuple[Any, ...]:
+        if get_deps is None:
+            return ()
+        try:
+            deps = get_deps(self)
+        except AttributeError:
+            # Some dependency is missing, so skip it (and any others that are missing)
+            deps = [getattr(self, name, _MISSING) for name in dep_names]
+            return tuple([dep for dep in deps if dep is not _MISSING])
+        return deps if len(dep_names) > 1 else (deps,)
+
     def decorator(func: InstanceMethod[P, T]) -> ReactiveMethod[P, T]:
         @wraps(func)
         def wrapper(self: Any, *args: Any, **kwargs: Any) -> Computed[T]:
-            object_deps = [getattr(self, name) for name in dep_names if hasattr(self, name)]
-            all_deps = (*object_deps, *args, *kwargs.values())
-            return Computed(lambda: func(self, *args, **kwargs), all_deps)
+            if not args and not kwargs:
+                # The common case of a method that only takes `self`
+                return Computed(partial(func, self), resolve_deps(self))
+            all_deps = (*resolve_deps(self), *args, *kwargs.values())
+            return Computed(partial(func, self, *args, **kwargs), all_deps)
 
         return wrapper
 
@@ -1683,7 +2442,7 @@ def as_signal(val: HasValue[T]) -> Signal[T]:
 
         ```
     """
-    return cast(Signal[T], val) if isinstance(val, Variable) else Signal(val)
+    return cast(Signal[T], val) if type(val) in _VARIABLE_TYPES else Signal(val)
 
 
 ReactiveValue: TypeAlias = Union[Computed[T], Signal[T]]
@@ -1771,22 +2530,56 @@ def deep_unref(value: Any) -> Any:
 
         ```
     """
-    # Base case - if it's a reactive value, unref it
-    if isinstance(value, Variable):
-        return deep_unref(unref(value))
-
-    # For containers, recursively unref their elements
-    if isinstance(value, np.ndarray):
-        return np.array([deep_unref(item) for item in value])
+    t = type(value)
+    # Leaves that can't contain reactive values are returned untouched
+    if t in _SCALAR_TYPES:
+        return value
+
+    # Base case - if it's a reactive value, unref it (`.value` resolves any further nesting)
+    # and carry on with its value, rather than starting over in a new call
+    if t in _VARIABLE_TYPES:
+        value = value.value
+        t = type(value)
+        if t in _SCALAR_TYPES:
+            return value
+
+    # For containers, recursively unref their elements, checking the builtin containers
+    # by exact type before falling back to the (comparatively slow) ``isinstance`` checks
+    if t is list:
+        return [deep_unref(item) for item in value]
+    if t is tuple:
+        # Tuples are immutable, so an empty one can be returned as-is
+        return tuple([deep_unref(item) for item in value]) if value else value
+    if t is dict:
+        return {deep_unref(k): deep_unref(v) for k, v in value.items()}
+    if isinstance(value, _ndarray):
+        # Only object arrays can hold reactive values, and only if some element isn't a
+        # scalar (collecting the element types is a C-level pass, unlike unreffing them)
+        if value.dtype == object and not _SCALAR_TYPES.issuperset(map(type, value.flat)):
+            # Unref each element in a single pass, then let numpy infer the dtype of the result
+            # (e.g., so an array of Signals holding floats becomes a float array)
+            unreffed = _deep_unref_ufunc(value, out=np.empty(value.shape, dtype=object))
+            try:
+                return np.array(unreffed.tolist())
+            except ValueError:
+                # Elements of different shapes can't be combined into a single array
+                return unreffed
+        return value
     if isinstance(value, dict):
-        return {deep_unref(unref(k)): deep_unref(unref(v)) for k, v in value.items()}
+        return {deep_unref(k): deep_unref(v) for k, v in value.items()}
     if isinstance(value, (list, tuple)):
-        return type(value)(deep_unref(item) for item in value)
+        return type(value)([deep_unref(item) for item in value])
     if isinstance(value, Iterable) and not isinstance(value, str):
+        # Unref the items once up front, so iterators aren't exhausted by a failed rebuild
+        items = [deep_unref(item) for item in value]
         try:
-            return type(value)(deep_unref(item) for item in value)  # pyright: ignore[reportCallIssue]
+            return type(value)(items)  # pyright: ignore[reportCallIssue]
         except TypeError:
-            return list(deep_unref(item) for item in value)
+            return items
 
     # For non-containers/non-reactive values, return as-is
     return value
+
+
+_deep_unref_ufunc = np.frompyfunc(deep_unref, 1, 1)
+"""`deep_unref` as a ufunc, for unreffing the elements of object arrays."""
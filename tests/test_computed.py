@@ -1,3 +1,8 @@
+import gc
+import weakref
+
+import numpy as np
+
 from signified import Computed, Signal, computed
 
 
@@ -96,3 +101,238 @@ def test_computed_container_with_deeply_nestedreactive_values():
     assert result.value == [1, 2, 3, 4, 5, 6]
     s[1][0].value = 10
     assert result.value == [1, 10, 3, 4, 5, 6]
+
+
+def test_computed_dict_with_reactive_values():
+    s = Signal(2)
+    result = computed(lambda d: d["a"] * 10)({"a": s})
+    assert result.value == 20
+    s.value = 3
+    assert result.value == 30
+
+
+def test_operator_results_are_not_kept_alive_by_dependencies():
+    s = Signal(1)
+    ref = weakref.ref(s + 1)
+    gc.collect()
+    assert ref() is None
+
+    # Dead references are dropped as new observers subscribe
+    for _ in range(100):
+        s + 1
+    assert len(s._observers) <= 2
+
+    # Results that are referenced elsewhere keep updating
+    c = (s + 1) * 2
+    s.value = 2
+    assert c.value == 6
+
+
+def test_observed_operator_result_is_collected_with_its_source():
+    s = Signal(1)
+    c = computed(lambda v: v + 1)(s * 2)
+    t = Signal(s + 1)
+    s.value = 2
+    assert c.value == 5
+    assert t.value == 3
+
+    ref = weakref.ref(s)
+    del s, c, t
+    gc.collect()
+    assert ref() is None
+
+
+def test_operator_result_with_observer_stays_alive():
+    s = Signal(1)
+    values = []
+
+    class Appender:
+        def __init__(self, c):
+            self.c = c
+
+        def update(self):
+            values.append(self.c.value)
+
+    c = s * 10
+    c.subscribe(Appender(c))
+    del c
+    gc.collect()
+    s.value = 2
+    assert values == [20]
+
+
+def test_computed_diamond_updates_once():
+    """Test that a Computed reachable along several paths is recomputed once per change."""
+    a = Signal(1)
+    b = a + 1
+    c = a * 2
+    seen = []
+
+    @computed
+    def total(x, y):
+        seen.append((x, y))
+        return x + y
+
+    d = total(b, c)
+    a.value = 2
+
+    assert d.value == 7
+    assert seen == [(2, 2), (3, 4)]
+
+
+def test_computed_with_keyword_arguments():
+    """Test the @computed decorator with reactive keyword arguments."""
+    s = Signal(2)
+
+    @computed
+    def scale(x, factor=1):
+        return x * factor
+
+    c = scale(3, factor=s)
+    assert c.value == 6
+    s.value = 5
+    assert c.value == 15
+
+    # Keyword names that aren't identifiers can still be passed via unpacking
+    d = computed(lambda **kwargs: kwargs)(**{"not-an-identifier": s, "class": 1})
+    assert d.value == {"not-an-identifier": 5, "class": 1}
+
+
+def test_computed_with_constant_arguments():
+    """Test the @computed decorator when no argument is reactive."""
+    calls = []
+
+    @computed
+    def add(x, y):
+        calls.append((x, y))
+        return x + y
+
+    c = add(1, y=2)
+    assert c.value == 3
+    assert calls == [(1, 2)]
+
+    # Reactive values nested in plain containers are still observed
+    s = Signal(1)
+    d = computed(sum)([s, 2])
+    s.value = 5
+    assert d.value == 7
+
+
+def test_computed_constant_arguments_are_copied():
+    """Test that functions can mutate constant container arguments without affecting the caller."""
+    s = Signal(1)
+    constant = [3, 1, 2]
+
+    @computed
+    def smallest_plus(x, items):
+        items.sort()
+        items.append(x)
+        return items[0] + x
+
+    c = smallest_plus(s, constant)
+    s.value = 2
+    assert c.value == 3
+    assert constant == [3, 1, 2]
+
+
+def test_computed_many_arguments():
+    """Test calls with more arguments than are compiled, mixing reactive values and constants."""
+    signals = [Signal(i) for i in range(10)]
+    items = [x for pair in zip(signals, range(10)) for x in pair]
+    total = computed(lambda *args: sum(args))(*items)
+    assert total.value == 90
+
+    signals[0].value = 10
+    assert total.value == 100
+
+
+def test_computed_skips_observers_when_value_is_unchanged():
+    """Test that an unchanged intermediate value doesn't re-run downstream functions."""
+    s = Signal(1)
+    calls = []
+    parity = computed(lambda x: x % 2)(s)
+
+    @computed
+    def describe(p):
+        calls.append(p)
+        return "odd" if p else "even"
+
+    d = describe(parity)
+    s.value = 3
+    assert d.value == "odd"
+    assert calls == [1]
+    s.value = 4
+    assert d.value == "even"
+    assert calls == [1, 0]
+
+
+def test_computed_without_observers_is_evaluated_when_read():
+    """Test that a Computed nobody observes is only re-evaluated when its value is read."""
+    s = Signal(1)
+    calls = []
+
+    @computed
+    def double(x):
+        calls.append(x)
+        return x * 2
+
+    c = double(s)
+    s.value = 2
+    s.value = 3
+    assert calls == [1]
+    assert c.value == 6
+    assert c.value == 6
+    assert calls == [1, 3]
+
+    # Values only observed by other computed values are still evaluated on read
+    d = c + 1
+    s.value = 4
+    assert calls == [1, 3]
+    assert d.value == 9
+    assert calls == [1, 3, 4]
+
+
+def test_computed_with_observer_is_evaluated_eagerly():
+    """Test that a Computed with an observer is brought up to date as soon as a dependency changes."""
+    s = Signal(1)
+    values = []
+
+    class Appender:
+        def __init__(self, c):
+            self.c = c
+
+        def update(self):
+            values.append(self.c.value)
+
+    c = s * 2
+    d = c + 1
+    d.subscribe(Appender(d))
+    s.value = 2
+    assert values == [5]
+
+    # Observers aren't updated if the value they observe didn't change
+    parity = s % 2
+    parity.subscribe(Appender(parity))
+    s.value = 4
+    assert values == [5, 9]
+
+
+def test_computed_with_deeply_nested_container():
+    """Test that reactive values nested deeper than the recursion limit are observed."""
+    s = Signal(1)
+    nested = [s]
+    for _ in range(5_000):
+        nested = [nested]
+    c = Computed(lambda: s.value * 2, dependencies=nested)
+    s.value = 2
+    assert c.value == 4
+
+
+def test_computed_object_array_of_signals():
+    """Test that numpy functions receive numeric arrays when given an object array of Signals."""
+    a = Signal(4.0)
+    result = computed(np.sqrt)(np.array([a, Signal(9.0)], dtype=object))
+    assert np.array_equal(result.value, [2.0, 3.0])
+
+    a.value = 16.0
+    assert np.array_equal(result.value, [4.0, 3.0])
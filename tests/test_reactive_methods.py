@@ -1,5 +1,8 @@
 import math
 
+import numpy as np
+import pytest
+
 from signified import Signal
 
 
@@ -106,6 +109,25 @@ def test_signal_attribute_access():
     assert s.y.value == 10
 
 
+def test_signal_missing_attribute():
+    """Test that accessing a missing attribute raises without subscribing anything."""
+    s = Signal(5)
+
+    with pytest.raises(AttributeError):
+        s.missing
+    assert not hasattr(s, "missing")
+    assert not s._observers
+
+
+def test_signal_set_attribute_missing_from_value():
+    """Test that attributes the underlying value lacks are stored on the Signal itself."""
+    s = Signal(1)
+    s.foo = 1
+
+    assert s.foo == 1
+    assert s.value == 1
+
+
 def test_signal_method_call():
     """Test method calls on Signal containing an object."""
 
@@ -121,6 +143,19 @@ def test_signal_method_call():
     assert s.double().value == 10
 
 
+def test_signal_call_with_reactive_arguments():
+    """Test calling a Signal containing a function with reactive arguments."""
+    f = Signal(lambda x, func: x + func)
+    x = Signal(1)
+    result = f(x, func=10)
+
+    assert result.value == 11
+    x.value = 2
+    assert result.value == 12
+    f.value = lambda x, func: x * func
+    assert result.value == 20
+
+
 def test_signal_indexing():
     """Test indexing on Signal containing a sequence."""
     s = Signal([1, 2, 3, 4, 5])
@@ -175,3 +210,17 @@ def test_signal_where():
 
     condition.value = False
     assert result.value == 10
+
+
+def test_signal_special_attributes_are_not_reactive():
+    """Test that special names are only forwarded to the underlying value reactively through `attr`."""
+    s = Signal(np.array([1, 2]))
+
+    assert not hasattr(s, "__array_interface__")
+    assert not s._observers
+
+    s = Signal(len)
+    name = s.attr("__name__")
+    assert name.value == "len"
+    s.value = print
+    assert name.value == "print"
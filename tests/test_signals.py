@@ -1,4 +1,9 @@
-from signified import Computed, Signal, unref
+import threading
+
+import numpy as np
+import pytest
+
+from signified import Computed, Signal, batch, computed, unref
 
 
 def test_signal_basic():
@@ -66,3 +71,232 @@ def test_signal_context_manager():
 
     assert s.value == 5
     assert t.value == 5
+
+
+def test_signal_numpy_array_change():
+    """Test that Signals holding arrays notify only when the array changes."""
+    s = Signal(np.array([1, 2]))
+    c = computed(len)(s)
+    calls = []
+
+    class Counter:
+        def update(self):
+            calls.append(True)
+
+    s.subscribe(Counter())
+
+    s.value = np.array([1, 2])
+    assert c.value == 2
+    assert calls == []
+
+    s.value = np.array([1, 2, 3])
+    assert c.value == 3
+    assert calls == [True]
+
+
+def test_signal_large_numpy_array_change():
+    """Test change detection for arrays large enough to be compared in chunks."""
+    s = Signal(np.zeros(100_000))
+    c = computed(np.sum)(s)
+
+    s.value = np.zeros(100_000)
+    assert c.value == 0
+
+    new = np.zeros(100_000)
+    new[-1] = 1
+    s.value = new
+    assert c.value == 1
+
+
+def test_signal_shared_dependencies():
+    """Test that a Signal stays subscribed to reactive values kept across assignments."""
+    a = Signal(1)
+    b = Signal(2)
+    s = Signal([a, b])
+    c = computed(sum)(s)
+
+    s.value = [a, Signal(10)]
+    assert c.value == 11
+
+    a.value = 5
+    assert c.value == 15
+
+    b.value = 100
+    assert c.value == 15
+
+
+def test_batch_updates_diamond_once():
+    """Test that a batch updates observers of several changed values once, in order."""
+    a = Signal(1)
+    b = Signal(2)
+    left = a + b
+    right = a * b
+    calls = []
+
+    @computed
+    def total(x, y):
+        calls.append((x, y))
+        return x + y
+
+    t = total(left, right)
+    updates = []
+
+    class Recorder:
+        def update(self):
+            updates.append(t.value)
+
+    t.subscribe(Recorder())
+    with batch():
+        a.value = 2
+        with batch():
+            b.value = 3
+        assert updates == []
+    assert updates == [11]
+    assert calls == [(3, 2), (5, 6)]
+
+
+def test_batch_reads_are_up_to_date():
+    """Test that computed values read within a batch reflect the values assigned so far."""
+    a = Signal(1)
+    t = a + 1
+    doubled = t * 2
+    updates = []
+
+    class Recorder:
+        def update(self):
+            updates.append(doubled.value)
+
+    doubled.subscribe(Recorder())
+    with batch():
+        a.value = 10
+        assert t.value == 11
+        assert doubled.value == 22
+        a.value = 20
+        assert t.value == 21
+        assert updates == []
+    assert doubled.value == 42
+    assert updates == [42]
+
+
+def test_batch_flushes_on_error():
+    """Test that observers are updated even if the batch block raises."""
+    s = Signal(1)
+    doubled = s * 2
+
+    with pytest.raises(RuntimeError):
+        with batch():
+            s.value = 5
+            raise RuntimeError
+    assert doubled.value == 10
+
+
+def test_batch_is_per_thread():
+    """Test that a batch open in one thread doesn't defer notifications in another."""
+    s = Signal(1)
+    calls = []
+    entered = threading.Event()
+    release = threading.Event()
+
+    class Recorder:
+        def update(self):
+            calls.append(threading.get_ident())
+
+    s.subscribe(Recorder())
+
+    def hold_batch():
+        with batch():
+            entered.set()
+            release.wait(timeout=5)
+
+    holder = threading.Thread(target=hold_batch)
+    holder.start()
+    try:
+        assert entered.wait(timeout=5)
+        s.value = 2
+        assert calls == [threading.get_ident()]
+    finally:
+        release.set()
+        holder.join()
+    assert calls == [threading.get_ident()]
+
+
+def test_signal_matmul_results_are_not_reused():
+    """Test that a reactive matrix product doesn't overwrite values handed out earlier."""
+    v = Signal(np.array([1.0, 2.0]))
+    result = v @ np.eye(2)
+    before = result.value
+
+    v.value = np.array([3.0, 4.0])
+    assert np.array_equal(result.value, [3.0, 4.0])
+    assert np.array_equal(before, [1.0, 2.0])
+
+
+def test_signal_same_object_does_not_notify():
+    """Test that assigning the value a Signal already holds doesn't notify observers."""
+    values = np.array([np.nan, 1.0])
+    s = Signal(values)
+    calls = []
+
+    class Counter:
+        def update(self):
+            calls.append(True)
+
+    s.subscribe(Counter())
+    s.value = values
+    assert calls == []
+    s.value = np.array([np.nan, 2.0])
+    assert calls == [True]
+
+
+def test_batch_repeated_writes_notify_once():
+    """Test that writing the same Signal repeatedly within a batch updates observers once."""
+    s = Signal(0)
+    calls = []
+
+    class Counter:
+        def update(self):
+            calls.append(s.value)
+
+    s.subscribe(Counter())
+    with batch():
+        for i in range(1, 4):
+            s.value = i
+    assert calls == [3]
+
+
+def test_batch_restored_value_does_not_notify():
+    """Test that a Signal set back to its original value within a batch doesn't update observers."""
+    s = Signal(1)
+    c = s * 2
+    calls = []
+
+    class Counter:
+        def update(self):
+            calls.append(True)
+
+    s.subscribe(Counter())
+    with batch():
+        with s.at(5):
+            assert c.value == 10
+    assert c.value == 2
+    assert calls == []
+
+    # Values created within the batch saw the temporary value, so they're still updated
+    with batch():
+        with s.at(5):
+            d = s + 1
+    assert d.value == 2
+
+
+def test_signal_value_assignment_replaces_object_with_value_attribute():
+    """Test that assigning `.value` replaces the value even if it has its own `value` attribute."""
+
+    class Box:
+        def __init__(self, value):
+            self.value = value
+
+    box = Box(1)
+    s = Signal(box)
+    s.value = Box(2)
+    assert s.value.value == 2
+    assert box.value == 1
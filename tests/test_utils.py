@@ -1,4 +1,6 @@
-from signified import Computed, Signal, as_signal, has_value, reactive_method, unref
+import numpy as np
+
+from signified import Computed, Signal, as_signal, deep_unref, has_value, reactive_method, unref
 
 
 def test_has_value():
@@ -47,3 +49,40 @@ def test_as_signal():
     assert isinstance(s2, Signal)
     assert s1.value == 5
     assert s2.value == 10
+
+
+def test_reactive_method_missing_dependency():
+    """Test that reactive_method ignores dependencies that don't exist."""
+
+    class MyClass:
+        def __init__(self):
+            self.x = Signal(5)
+
+        @reactive_method("x", "missing")
+        def double(self):
+            return self.x.value * 2
+
+    obj = MyClass()
+    result = obj.double()
+
+    assert result.value == 10
+    obj.x.value = 7
+    assert result.value == 14
+
+
+def test_deep_unref_iterator():
+    """Test that deep_unref falls back to a list for iterables that can't be rebuilt."""
+    assert deep_unref(iter([Signal(1), 2, Signal(Signal(3))])) == [1, 2, 3]
+
+
+def test_deep_unref_object_array():
+    """Test that deep_unref only rebuilds object arrays that can contain reactive values."""
+    plain = np.array([1, "a", None], dtype=object)
+    assert deep_unref(plain) is plain
+
+    nested = np.array([1, [Signal(2)]], dtype=object)
+    assert deep_unref(nested).tolist() == [1, [2]]
+
+    numeric = np.array([[Signal(4.0), 0.0], [0.0, Signal(2.0)]], dtype=object)
+    assert deep_unref(numeric).dtype == np.float64
+    assert np.array_equal(np.linalg.inv(deep_unref(numeric)), [[0.25, 0.0], [0.0, 0.5]])